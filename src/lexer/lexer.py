@@ -1,5 +1,6 @@
 from __future__ import annotations
 import json
+import sys
 from automaton import DFA
 from automaton.dfa import DFAConfig
 from syntax import Token, TokenType
@@ -40,23 +41,22 @@ class Lexer:
         reader = Reader(source_code)
         tokens = []
         while not reader.eof():
-            start_pos = reader.pos.index
-            lexeme = ""
+            start_pos = reader.index
             self.dfa.reset()
             last_accepted_state = None
-            accepted_lexeme = ""
             accepted_pos = None  # Track position after accepted lexeme
 
             while not reader.eof() and self.dfa.can_transition(reader.current_char):
-                lexeme += reader.current_char
                 self.dfa.step(reader.current_char)
                 reader.advance()
                 if self.dfa.get_token_type():
                     last_accepted_state = self.dfa.current_state
-                    accepted_lexeme = lexeme
-                    accepted_pos = reader.pos.index  # Save position after this character
+                    accepted_pos = reader.index  # Save position after this character
 
-            if accepted_lexeme:
+            if accepted_pos is not None:
+                # Slice the lexeme once from the source instead of growing a
+                # string character by character during the DFA walk.
+                accepted_lexeme = source_code[start_pos:accepted_pos]
                 token_type_str = self.config.final_states.get(
                     last_accepted_state)
                 token_type = TokenType[token_type_str]
@@ -66,16 +66,19 @@ class Lexer:
                 elif token_type == TokenType.IDENTIFIER and accepted_lexeme.lower() in self.keywords:
                     token_type = TokenType.KEYWORD
 
+                # Intern lexemes so identifiers recurring across the source
+                # share one string object (and its cached hash) in every
+                # later dict/symbol-table lookup.
                 tokens.append(
                     Token(
                         type=token_type,
-                        value=accepted_lexeme,
+                        value=sys.intern(accepted_lexeme),
                         start=start_pos,
                         end=start_pos + len(accepted_lexeme),
                     )
                 )
                 # Position reader right after the accepted lexeme (only if we overshot)
-                if reader.pos.index != accepted_pos:
+                if reader.index != accepted_pos:
                     reader.set_position(accepted_pos)
 
             elif not reader.eof():
@@ -84,8 +87,8 @@ class Lexer:
                     Token(
                         type=TokenType.UNKNOWN,
                         value=reader.current_char,
-                        start=reader.pos.index,
-                        end=reader.pos.index + 1,
+                        start=reader.index,
+                        end=reader.index + 1,
                     )
                 )
                 reader.advance()
@@ -3,7 +3,7 @@ AST nodes for declarations (var, const, type, procedure, function).
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 from .base import ASTNode
 
@@ -65,6 +65,10 @@ class TypeDeclaration(ASTNode):
 
     identifier: str
     type_spec: TypeSpec
+    name_lc: str = field(init=False)  # lowercased identifier, computed once
+
+    def __post_init__(self):
+        self.name_lc = self.identifier.lower()
 
     def accept(self, visitor: Any) -> Any:
         return visitor.visit_type_declaration(self)
@@ -174,6 +178,10 @@ class SimpleType(TypeSpec):
     """
 
     name: str
+    name_lc: str = field(init=False)  # lowercased name, computed once
+
+    def __post_init__(self):
+        self.name_lc = self.name.lower()
 
     def accept(self, visitor: Any) -> Any:
         return visitor.visit_simple_type(self)
@@ -198,12 +206,16 @@ class ArrayType(TypeSpec):
 
     index_type: Any  # Could be SimpleType or range (start..end)
     element_type: TypeSpec
+    is_range: bool = field(init=False)  # True when index_type is a (start, end) range
+
+    def __post_init__(self):
+        self.is_range = isinstance(self.index_type, tuple)
 
     def accept(self, visitor: Any) -> Any:
         return visitor.visit_array_type(self)
 
     def to_dict(self) -> dict:
-        if isinstance(self.index_type, tuple):
+        if self.is_range:
             # Range type (start..end)
             start = self.index_type[0].to_dict() if hasattr(
                 self.index_type[0], 'to_dict') else self.index_type[0]
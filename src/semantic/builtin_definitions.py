@@ -54,3 +54,7 @@ STANDARD_LIBRARY = [
     ('succ', ObjectKind.FUNCTION, INTEGER_TYPE),
     ('pred', ObjectKind.FUNCTION, INTEGER_TYPE),
 ]
+
+# Concatenated once here so every SemanticVisitor construction iterates a
+# shared tuple instead of rebuilding the combined list.
+ALL_BUILTINS = tuple(RESERVED_WORDS + STANDARD_LIBRARY)
@@ -44,6 +44,9 @@ class BlockEntry:
         self.lpar = lpar
         self.psze = psze
         self.vsze = vsze
+        # name -> tab index for every entry in this block; newest wins,
+        # matching the order a link-chain walk would find them in.
+        self.names: dict[str, int] = {}
 
 
 class SymbolTable:
@@ -83,6 +86,7 @@ class SymbolTable:
                 address = 0
 
         self.btab[block_idx].last = self.tx
+        self.btab[block_idx].names[name] = self.tx
 
         entry = SymbolEntry(
             name=name,
@@ -118,20 +122,21 @@ class SymbolTable:
 
     def lookup(self, name: str) -> Optional[int]:
         for lev in range(self.level, -1, -1):
-            block_idx = self.display[lev]
-            i = self.btab[block_idx].last
-
-            while i != 0:
-                if self.tab[i].name == name:
-                    return i
-                i = self.tab[i].link
+            idx = self.btab[self.display[lev]].names.get(name)
+            if idx is not None:
+                return idx
 
+        # Fallback for level-0 entries living outside the display chain
+        # (e.g. record fields entered in their own block).
         for i in range(self.tx, -1, -1):
             if self.tab[i].name == name and self.tab[i].level == 0:
                 return i
         return None
 
     def lookup_current_scope(self, name: str) -> Optional[int]:
+        # Duplicate checks walk the link chain rather than the names dict:
+        # the chain is cut at variable/non-variable boundaries, and those
+        # cuts are part of what counts as a redeclaration here.
         block_idx = self.display[self.level]
         i = self.btab[block_idx].last
 
@@ -139,7 +144,6 @@ class SymbolTable:
             if self.tab[i].name == name:
                 return i
             i = self.tab[i].link
-
         return None
 
     def enter_scope(self):
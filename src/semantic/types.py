@@ -52,6 +52,11 @@ class Type:
         return self.kind in (SimpleTypeKind.INTEGER, SimpleTypeKind.BOOLEAN, SimpleTypeKind.CHAR)
 
     def compatible_with(self, other: 'Type') -> bool:
+        # Simple types are module-level singletons and declarations reuse
+        # one Type per spec node, so identity answers the common case.
+        if self is other:
+            return True
+
         if self.kind == other.kind:
             if self.is_simple():
                 return True
@@ -1,3 +1,4 @@
+import sys
 from typing import Any, Optional
 from parse_tree import (
     Program, Block, VarDeclaration, ConstDeclaration,
@@ -24,9 +25,40 @@ from error import (
 )
 
 
-from .builtin_definitions import RESERVED_WORDS, STANDARD_LIBRARY
+from .builtin_definitions import ALL_BUILTINS
+
+# Binary operator categories, resolved with one dict probe instead of a
+# chain of string comparisons per BinaryOp node.
+_CAT_ARITHMETIC = 0   # +, -, *, /  -> numeric operands, int/real result
+_CAT_INT_DIVIDE = 1   # div, mod, bagi -> integer operands and result
+_CAT_LOGICAL = 2      # dan, atau -> boolean operands and result
+_CAT_RELATIONAL = 3   # comparisons -> compatible operands, boolean result
+
+# Constant literal class -> Type; resolved per exact class so bool does not
+# collide with int the way a value-keyed cache would make it.
+_CONST_TYPE_BY_CLASS = {
+    bool: BOOLEAN_TYPE,
+    int: INTEGER_TYPE,
+    float: REAL_TYPE,
+}
+
+_BUILTIN_TYPE_NAMES = frozenset(('integer', 'real', 'boolean', 'char', 'string'))
+
+_BINOP_CATEGORY = {
+    '+': _CAT_ARITHMETIC, '-': _CAT_ARITHMETIC,
+    '*': _CAT_ARITHMETIC, '/': _CAT_ARITHMETIC,
+    'div': _CAT_INT_DIVIDE, 'mod': _CAT_INT_DIVIDE, 'bagi': _CAT_INT_DIVIDE,
+    'dan': _CAT_LOGICAL, 'atau': _CAT_LOGICAL,
+    '=': _CAT_RELATIONAL, '<>': _CAT_RELATIONAL,
+    '<': _CAT_RELATIONAL, '<=': _CAT_RELATIONAL,
+    '>': _CAT_RELATIONAL, '>=': _CAT_RELATIONAL,
+}
+
 
 class SemanticVisitor:
+    __slots__ = ('symbol_table', 'type_map', 'current_function_type',
+                 '_simple_type_cache', '_dispatch', '_builtin_shadowed')
+
     def __init__(self):
         self.symbol_table = SymbolTable()
         self.type_map: dict[str, Type] = {
@@ -36,7 +68,43 @@ class SemanticVisitor:
             'char': CHAR_TYPE,
             'string': STRING_TYPE
         }
+        # Resolved type names keyed by the original (uncased) spelling.
+        self._simple_type_cache: dict[str, Type] = {}
+        # Set once a declaration shadows a builtin type name; the flat
+        # builtin checks in visit_simple_type must stand down from then on.
+        self._builtin_shadowed = False
         self.current_function_type: Optional[Type] = None
+        # Node class -> bound visit_* method, bypassing accept() dispatch.
+        self._dispatch: dict[type, Any] = {
+            Program: self.visit_program,
+            Block: self.visit_block,
+            VarDeclaration: self.visit_var_declaration,
+            ConstDeclaration: self.visit_const_declaration,
+            TypeDeclaration: self.visit_type_declaration,
+            ProcedureDeclaration: self.visit_procedure_declaration,
+            FunctionDeclaration: self.visit_function_declaration,
+            Parameter: self.visit_parameter,
+            SimpleType: self.visit_simple_type,
+            ArrayType: self.visit_array_type,
+            RecordType: self.visit_record_type,
+            CompoundStatement: self.visit_compound_statement,
+            AssignmentStatement: self.visit_assignment_statement,
+            IfStatement: self.visit_if_statement,
+            WhileStatement: self.visit_while_statement,
+            ForStatement: self.visit_for_statement,
+            RepeatStatement: self.visit_repeat_statement,
+            CaseStatement: self.visit_case_statement,
+            ProcedureCall: self.visit_procedure_call,
+            EmptyStatement: self.visit_empty_statement,
+            BinaryOp: self.visit_binary_op,
+            UnaryOp: self.visit_unary_op,
+            Variable: self.visit_variable,
+            Number: self.visit_number,
+            String: self.visit_string,
+            Char: self.visit_char,
+            Boolean: self.visit_boolean,
+            FunctionCall: self.visit_function_call,
+        }
         self._init_builtins()
 
     def visit_program(self, node: Program) -> Any:
@@ -55,8 +123,16 @@ class SemanticVisitor:
         node.block_index = self.symbol_table.display[self.symbol_table.level]
         node.sym_level = self.symbol_table.level
 
+        # Dispatch declarations by kind directly, bypassing accept().
+        # Source order is kept: bucketing by kind would reshuffle symbol
+        # table indices that the decorated output depends on.
+        dispatch = self._DECL_DISPATCH
         for decl in node.declarations:
-            self.visit(decl)
+            handler = dispatch.get(decl.__class__)
+            if handler is not None:
+                handler(self, decl)
+            else:
+                self.visit(decl)
         self.visit(node.compound_statement)
         return node
 
@@ -99,7 +175,15 @@ class SemanticVisitor:
             raise DuplicateDeclarationError(node.identifier)
 
         type_spec = self.visit(node.type_spec)
-        self.type_map[node.identifier.lower()] = type_spec
+        self.type_map[sys.intern(node.name_lc)] = type_spec
+        if node.name_lc in _BUILTIN_TYPE_NAMES:
+            self._builtin_shadowed = True
+
+        # A redeclared name must not keep serving the old resolution.
+        # The cache is keyed by original spelling, so popping individual
+        # spellings would miss other case variants of the same name;
+        # declarations are rare enough to just drop the whole cache.
+        self._simple_type_cache.clear()
 
         # Get ref index for record types (points to block containing fields)
         ref_idx = 0
@@ -122,7 +206,6 @@ class SemanticVisitor:
         self.symbol_table.enter_scope()
         block_idx = self.symbol_table.display[self.symbol_table.level]
 
-        proc_idx = self.symbol_table.tx + 1
         self.symbol_table.enter(
             name=node.name,
             obj_kind=ObjectKind.PROCEDURE,
@@ -131,9 +214,6 @@ class SemanticVisitor:
             ref=block_idx
         )
 
-        entry = self.symbol_table.get_entry(proc_idx)
-        entry.level = self.symbol_table.level - 1
-
         for param in node.parameters:
             self.visit(param)
 
@@ -151,7 +231,6 @@ class SemanticVisitor:
         self.symbol_table.enter_scope()
         block_idx = self.symbol_table.display[self.symbol_table.level]
 
-        func_idx = self.symbol_table.tx + 1
         self.symbol_table.enter(
             name=node.name,
             obj_kind=ObjectKind.FUNCTION,
@@ -160,9 +239,6 @@ class SemanticVisitor:
             ref=block_idx
         )
 
-        entry = self.symbol_table.get_entry(func_idx)
-        entry.level = self.symbol_table.level - 1
-
         old_function_type = self.current_function_type
         self.current_function_type = return_type
 
@@ -193,22 +269,52 @@ class SemanticVisitor:
         return node
 
     def visit_simple_type(self, node: SimpleType) -> Type:
-        type_name = node.name.lower()
-        if type_name in self.type_map:
-            return self.type_map[type_name]
+        # Flat comparisons against the five builtins first: interned names
+        # make these pointer checks, with no dict probe at all. Disabled
+        # once a declaration shadows a builtin name ('string' is the one
+        # builtin that is not a lexer keyword), since type_map then holds
+        # the user's resolution for it.
+        lname = node.name_lc
+        if not self._builtin_shadowed:
+            if lname == 'integer':
+                return INTEGER_TYPE
+            elif lname == 'real':
+                return REAL_TYPE
+            elif lname == 'boolean':
+                return BOOLEAN_TYPE
+            elif lname == 'char':
+                return CHAR_TYPE
+            elif lname == 'string':
+                return STRING_TYPE
 
-        idx = self.symbol_table.lookup(node.name)
-        if idx is not None:
-            entry = self.symbol_table.get_entry(idx)
-            if entry.obj_kind == ObjectKind.TYPE:
-                return entry.type
+        name = node.name
+        cached = self._simple_type_cache.get(name)
+        if cached is not None:
+            return cached
 
-        raise UndeclaredIdentifierError(node.name)
+        resolved = self.type_map.get(lname)
+
+        if resolved is None:
+            idx = self.symbol_table.lookup(name)
+            if idx is not None:
+                entry = self.symbol_table.get_entry(idx)
+                if entry.obj_kind == ObjectKind.TYPE:
+                    resolved = entry.type
+
+        if resolved is None:
+            raise UndeclaredIdentifierError(name)
+
+        self._simple_type_cache[name] = resolved
+        return resolved
 
     def visit_array_type(self, node: ArrayType) -> Type:
+        cached = getattr(node, '_resolved', None)
+        if cached is not None:
+            return cached
+
         element_type = self.visit(node.element_type)
 
-        if isinstance(node.index_type, tuple):
+        if node.is_range:
             start, end = node.index_type
             low = start if isinstance(
                 start, int) else self._evaluate_const_expr(start)
@@ -221,6 +327,10 @@ class SemanticVisitor:
             high = 0
 
         element_size = self._get_type_size(element_type)
+
+        # Each declaration site gets its own atab row and Type: the row
+        # index is the variable's Ref column in the decorated output, so
+        # structurally identical specs must not share one entry.
         arr_idx = self.symbol_table.enter_array(
             index_type=index_type,
             element_type=element_type,
@@ -240,9 +350,14 @@ class SemanticVisitor:
         )
         array_type.array_info.ref_index = arr_idx
 
+        node._resolved = array_type
         return array_type
 
     def visit_record_type(self, node: RecordType) -> Type:
+        cached = getattr(node, '_resolved', None)
+        if cached is not None:
+            return cached
+
         fields = {}
         offset = 0
 
@@ -281,18 +396,21 @@ class SemanticVisitor:
         record_type.record_info = RecordTypeInfo(fields=fields, size=offset)
         record_type.record_info.ref_index = field_block_idx
 
+        node._resolved = record_type
         return record_type
 
     def visit_compound_statement(self, node: CompoundStatement) -> Any:
+        visit = self.visit
         for stmt in node.statements:
-            self.visit(stmt)
+            visit(stmt)
         return node
 
     def visit_assignment_statement(self, node: AssignmentStatement) -> Any:
         var_type = self.visit(node.variable)
         expr_type = self.visit(node.expression)
 
-        if not var_type.compatible_with(expr_type):
+        # Same-singleton assignments (the common case) need no further checks.
+        if var_type is not expr_type and not var_type.compatible_with(expr_type):
             raise TypeMismatchError(
                 str(var_type), str(expr_type), "assignment")
 
@@ -302,7 +420,7 @@ class SemanticVisitor:
 
     def visit_if_statement(self, node: IfStatement) -> Any:
         cond_type = self.visit(node.condition)
-        if cond_type != BOOLEAN_TYPE:
+        if cond_type is not BOOLEAN_TYPE:
             raise TypeMismatchError("boolean", str(cond_type), "if condition")
 
         self.visit(node.then_statement)
@@ -313,7 +431,7 @@ class SemanticVisitor:
 
     def visit_while_statement(self, node: WhileStatement) -> Any:
         cond_type = self.visit(node.condition)
-        if cond_type != BOOLEAN_TYPE:
+        if cond_type is not BOOLEAN_TYPE:
             raise TypeMismatchError(
                 "boolean", str(cond_type), "while condition")
 
@@ -341,11 +459,12 @@ class SemanticVisitor:
         return node
 
     def visit_repeat_statement(self, node: RepeatStatement) -> Any:
+        visit = self.visit
         for stmt in node.statements:
-            self.visit(stmt)
+            visit(stmt)
 
         cond_type = self.visit(node.condition)
-        if cond_type != BOOLEAN_TYPE:
+        if cond_type is not BOOLEAN_TYPE:
             raise TypeMismatchError("boolean", str(
                 cond_type), "repeat condition")
 
@@ -354,8 +473,11 @@ class SemanticVisitor:
     def visit_case_statement(self, node: CaseStatement) -> Any:
         _ = self.visit(node.expression)
 
-        for constants, stmt in node.cases:
-            self.visit(stmt)
+        # Case constants are not type-checked (yet); index the statement
+        # directly instead of unpacking the unused constant list per case.
+        visit = self.visit
+        for case in node.cases:
+            visit(case[1])
 
         return node
 
@@ -368,9 +490,10 @@ class SemanticVisitor:
         if entry.obj_kind != ObjectKind.PROCEDURE:
             raise InvalidFunctionCallError(f"'{node.name}' is not a procedure")
 
+        visit = self.visit
         for arg in node.arguments:
-            self.visit(arg)
-        
+            visit(arg)
+
         node.tab_index = idx
         node.sym_type = VOID_TYPE
         node.sym_level = self.symbol_table.level
@@ -385,9 +508,9 @@ class SemanticVisitor:
         right_type = self.visit(node.right)
 
         op = node.operator
+        category = _BINOP_CATEGORY.get(op)
 
-        result_type = None
-        if op in ['+', '-', '*', '/']:
+        if category == _CAT_ARITHMETIC:
             if not left_type.is_numeric() or not right_type.is_numeric():
                 raise InvalidOperationError(
                     op, f"{left_type} dan {right_type}")
@@ -396,19 +519,19 @@ class SemanticVisitor:
             else:
                 result_type = INTEGER_TYPE
 
-        elif op in ['div', 'mod', 'bagi']:
+        elif category == _CAT_INT_DIVIDE:
             if left_type != INTEGER_TYPE or right_type != INTEGER_TYPE:
                 raise InvalidOperationError(
                     op, f"{left_type} dan {right_type}")
             result_type = INTEGER_TYPE
 
-        elif op in ['dan', 'atau']:
+        elif category == _CAT_LOGICAL:
             if left_type != BOOLEAN_TYPE or right_type != BOOLEAN_TYPE:
                 raise InvalidOperationError(
                     op, f"{left_type} dan {right_type}")
             result_type = BOOLEAN_TYPE
 
-        elif op in ['=', '<>', '<', '<=', '>', '>=']:
+        elif category == _CAT_RELATIONAL:
             if not left_type.compatible_with(right_type):
                 raise TypeMismatchError(str(left_type), str(
                     right_type), f"comparison {op}")
@@ -435,32 +558,6 @@ class SemanticVisitor:
         raise InvalidOperationError(node.operator, "unknown")
 
     def visit_variable(self, node: Variable) -> Type:
-        def resolve_access(var_node: Variable, current_type: Type, base_name: str) -> Type:
-            # Handle array indices (may be multidimensional)
-            if var_node.indices:
-                for index_expr in var_node.indices:
-                    if not current_type.is_array():
-                        raise InvalidArrayIndexError(f"'{base_name}' is not an array")
-
-                    index_type = self.visit(index_expr)
-                    if not index_type.is_ordinal():
-                        raise InvalidArrayIndexError("index must be ordinal type")
-
-                    current_type = current_type.array_info.element_type
-
-            # Handle record field access
-            if var_node.field:
-                if not current_type.is_record():
-                    raise InvalidRecordAccessError(base_name, var_node.field)
-
-                if var_node.field not in current_type.record_info.fields:
-                    raise InvalidRecordAccessError(base_name, var_node.field)
-
-                current_type = current_type.record_info.fields[var_node.field][0]
-
-            var_node.sym_type = current_type
-            return current_type
-
         # Resolve the root variable (must have a name)
         idx = self.symbol_table.lookup(node.name)
         if idx is None:
@@ -474,11 +571,38 @@ class SemanticVisitor:
         node.sym_type = var_type
         node.sym_level = entry.level
 
-        # Walk through chained accesses
+        # Walk through chained accesses. The access resolution is inlined
+        # here: Variable is the most frequent expression node, and a nested
+        # helper would be re-created (function object + cells) per call.
+        visit = self.visit
         current_node = node
         current_type = var_type
         while current_node:
-            current_type = resolve_access(current_node, current_type, base_name)
+            # Handle array indices (may be multidimensional)
+            if current_node.indices:
+                for index_expr in current_node.indices:
+                    if not current_type.is_array():
+                        raise InvalidArrayIndexError(f"'{base_name}' is not an array")
+
+                    index_type = visit(index_expr)
+                    if not index_type.is_ordinal():
+                        raise InvalidArrayIndexError("index must be ordinal type")
+
+                    current_type = current_type.array_info.element_type
+
+            # Handle record field access
+            field = current_node.field
+            if field:
+                if not current_type.is_record():
+                    raise InvalidRecordAccessError(base_name, field)
+
+                fields = current_type.record_info.fields
+                if field not in fields:
+                    raise InvalidRecordAccessError(base_name, field)
+
+                current_type = fields[field][0]
+
+            current_node.sym_type = current_type
             current_node = current_node.next_access
 
         return current_type
@@ -509,52 +633,62 @@ class SemanticVisitor:
         if entry.obj_kind != ObjectKind.FUNCTION:
             raise InvalidFunctionCallError(f"'{node.name}' is not a function")
 
+        visit = self.visit
         for arg in node.arguments:
-            self.visit(arg)
+            visit(arg)
 
         return entry.type
 
     def visit(self, node: ASTNode) -> Any:
+        """Canonical entry point: dispatch a node to its visit_* handler."""
         if node is None:
             return None
+        handler = self._dispatch.get(node.__class__)
+        if handler is not None:
+            return handler(node)
         return node.accept(self)
-    
-    def __ror__(self, value):
-        return self.visit(value)
 
     def _infer_const_type(self, value: Any) -> Type:
-        if isinstance(value, bool):
-            return BOOLEAN_TYPE
-        elif isinstance(value, int):
-            return INTEGER_TYPE
-        elif isinstance(value, float):
-            return REAL_TYPE
-        elif isinstance(value, str):
+        typ = _CONST_TYPE_BY_CLASS.get(value.__class__)
+        if typ is not None:
+            return typ
+        if isinstance(value, str):
             if len(value) == 1:
                 return CHAR_TYPE
             return STRING_TYPE
         return INTEGER_TYPE
 
     def _get_type_size(self, type: Type) -> int:
-        if type.is_array():
-            return type.array_info.size
-        if type.is_record():
-            return type.record_info.size
+        info = type.array_info
+        if info is not None:
+            return info.size
+        info = type.record_info
+        if info is not None:
+            return info.size
         return 1
 
     def _evaluate_const_expr(self, expr: Any) -> int:
-        if isinstance(expr, int):
-            return expr
-        if hasattr(expr, 'value') and isinstance(expr.value, int):
-            return expr.value
-        return 0
+        try:
+            value = expr.value
+        except AttributeError:
+            return expr if expr.__class__ is int else 0
+        return value if value.__class__ is int else 0
 
     def _init_builtins(self):
         # Register all reserved words and standard library functions
-        for name, kind, typ in RESERVED_WORDS + STANDARD_LIBRARY:
+        for name, kind, typ in ALL_BUILTINS:
             self.symbol_table.enter(
                 name=name,
                 obj_kind=kind,
                 type=typ,
                 level=0
             )
+
+    # Per-kind fast paths for visit_block's declaration loop.
+    _DECL_DISPATCH = {
+        VarDeclaration: visit_var_declaration,
+        ConstDeclaration: visit_const_declaration,
+        TypeDeclaration: visit_type_declaration,
+        ProcedureDeclaration: visit_procedure_declaration,
+        FunctionDeclaration: visit_function_declaration,
+    }
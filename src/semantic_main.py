@@ -3,19 +3,25 @@ import json
 import sys
 import io
 import os
+
+try:
+    import orjson  # optional: much faster JSON serialization
+except ImportError:
+    orjson = None
 from pathlib import Path
 from lexer import Lexer
 from parser import Parser
 from semantic import SemanticVisitor
-from semantic.printer import DecoratedASTPrinter
 from error import SemanticError
 from parse_tree.contract import validate_ast_contract
-from semantic.decorated_contract import validate_decorated_ast
 from utils.error_context import maybe_print_error_context_from_exception
 
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+# Read once at import; the flag cannot change mid-process anyway.
+_DEBUG_DECORATED = os.environ.get("DEBUG_DECORATED_AST") == "1"
+
 
 def main():
     parser_cli = argparse.ArgumentParser(
@@ -63,10 +69,12 @@ def main():
         validate_ast_contract(parse_tree)
         semantic_visitor.visit(parse_tree)
         
-        if os.getenv("DEBUG_DECORATED_AST") == "1":
+        if _DEBUG_DECORATED:
+            from semantic.decorated_contract import validate_decorated_ast
             validate_decorated_ast(parse_tree, strict=False)
 
         if args.decorated:
+            from semantic.printer import DecoratedASTPrinter
             printer = DecoratedASTPrinter()
             print("\nDecorated AST:")
             print("=" * 40)
@@ -107,9 +115,16 @@ def main():
 
 
 
+# Row templates bound once so the format specs are parsed a single time
+# instead of per row.
+_TAB_ROW = "{:<6} {:<20} {:<12} {:<15} {:<6} {:<6} {:<6} {:<6}".format
+_ATAB_ROW = "{:<6} {:<12} {:<20} {:<8} {:<8} {:<8} {:<8}".format
+_BTAB_ROW = "{:<6} {:<8} {:<8} {:<8} {:<8}".format
+
+
 def format_symbol_table(symtab, format_type):
     if format_type == "json":
-        return json.dumps({
+        data = {
             'tab': [
                 {
                     'name': entry.name,
@@ -141,7 +156,10 @@ def format_symbol_table(symtab, format_type):
                 }
                 for entry in symtab.btab
             ]
-        }, indent=2, ensure_ascii=False)
+        }
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(data, indent=2, ensure_ascii=False)
     else:
         lines = []
         lines.append("=" * 80)
@@ -150,11 +168,10 @@ def format_symbol_table(symtab, format_type):
         lines.append(f"{'Index':<6} {'Name':<20} {'Kind':<12} {'Type':<15} {'Level':<6} {'Addr':<6} {'Ref':<6} {'Link':<6}")
         lines.append("-" * 80)
         for i, entry in enumerate(symtab.tab):
-            lines.append(
-                f"{i:<6} {entry.name:<20} {entry.obj_kind.name:<12} "
-                f"{str(entry.type):<15} {entry.level:<6} {entry.address:<6} "
-                f"{entry.ref:<6} {entry.link:<6}"
-            )
+            lines.append(_TAB_ROW(
+                i, entry.name, entry.obj_kind.name, str(entry.type),
+                entry.level, entry.address, entry.ref, entry.link
+            ))
 
         if symtab.atab:
             lines.append("\n" + "=" * 88)
@@ -163,10 +180,10 @@ def format_symbol_table(symtab, format_type):
             lines.append(f"{'Index':<6} {'IdxType':<12} {'ElemType':<20} {'Low':<8} {'High':<8} {'ElemSz':<8} {'Size':<8}")
             lines.append("-" * 88)
             for i, entry in enumerate(symtab.atab):
-                lines.append(
-                    f"{i:<6} {str(entry.index_type):<12} {str(entry.element_type):<20} "
-                    f"{entry.low:<8} {entry.high:<8} {entry.element_size:<8} {entry.size:<8}"
-                )
+                lines.append(_ATAB_ROW(
+                    i, str(entry.index_type), str(entry.element_type),
+                    entry.low, entry.high, entry.element_size, entry.size
+                ))
 
         if symtab.btab:
             lines.append("\n" + "=" * 80)
@@ -175,10 +192,9 @@ def format_symbol_table(symtab, format_type):
             lines.append(f"{'Index':<6} {'Last':<8} {'LPar':<8} {'PSize':<8} {'VSize':<8}")
             lines.append("-" * 80)
             for i, entry in enumerate(symtab.btab):
-                lines.append(
-                    f"{i:<6} {entry.last:<8} {entry.lpar:<8} "
-                    f"{entry.psze:<8} {entry.vsze:<8}"
-                )
+                lines.append(_BTAB_ROW(
+                    i, entry.last, entry.lpar, entry.psze, entry.vsze
+                ))
 
         return "\n".join(lines)
 
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Represents a position in source text (line, column, and index)."""
     index: int
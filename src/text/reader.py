@@ -9,28 +9,43 @@ class Reader:
 
     def __init__(self, text: str) -> None:
         self.text = text
-        self.pos = Position(0, 1, 1)
-        self.current_char: Optional[str] = self.text[self.pos.index] if self.text else None
+        self._len = len(text)
+        # Position is tracked as three plain ints so advance() stays
+        # allocation-free; a Position object is only built on demand.
+        self.index = 0
+        self._line = 1
+        self._col = 1
+        self.current_char: Optional[str] = self.text[0] if self.text else None
 
     @classmethod
     def from_file(cls, path: str) -> "Reader":
         with open(path, "r", encoding="utf-8") as f:
             return cls(f.read())
 
+    @property
+    def pos(self) -> Position:
+        """Snapshot of the current position as an immutable Position."""
+        return Position(self.index, self._line, self._col)
+
     def advance(self) -> None:
         """Move to the next character."""
         if self.current_char is None:
             return
-        self.pos = self.pos.advance(self.current_char)
-        if self.pos.index >= len(self.text):
+        if self.current_char == '\n':
+            self._line += 1
+            self._col = 1
+        else:
+            self._col += 1
+        self.index += 1
+        if self.index >= self._len:
             self.current_char = None
         else:
-            self.current_char = self.text[self.pos.index]
+            self.current_char = self.text[self.index]
 
     def peek(self, k: int = 1) -> Optional[str]:
         """Look ahead `k` characters without consuming them."""
-        idx = self.pos.index + k
-        if 0 <= idx < len(self.text):
+        idx = self.index + k
+        if 0 <= idx < self._len:
             return self.text[idx]
         return None
 
@@ -45,7 +60,7 @@ class Reader:
 
     def set_position(self, index: int) -> None:
         """Set the reader position to a specific index."""
-        if index < 0 or index > len(self.text):
+        if index < 0 or index > self._len:
             raise ValueError(f"Invalid index: {index}")
 
         # Reset to beginning and advance to desired position
@@ -58,8 +73,10 @@ class Reader:
             else:
                 col += 1
 
-        self.pos = Position(index, line, col)
-        if index >= len(self.text):
+        self.index = index
+        self._line = line
+        self._col = col
+        if index >= self._len:
             self.current_char = None
         else:
             self.current_char = self.text[index]
@@ -3,14 +3,12 @@ from __future__ import annotations
 
 import os
 import sys
+from array import array
 from dataclasses import dataclass
-from typing import Optional, Tuple, Any
+from functools import lru_cache
+from typing import Iterator, NamedTuple, Optional, Sequence, Tuple, Any
 
-from text import Position  # your Position(index,line,column) 
-
-
-@dataclass(frozen=True)
-class SourceLocation:
+class SourceLocation(NamedTuple):
     """Normalized location for printing context."""
     index: int               # 0-based character index in source
     line: int                # 1-based
@@ -18,29 +16,61 @@ class SourceLocation:
     span: int = 1            # caret span length
 
 
+# Flag values cached on first read; the environment does not change
+# mid-process, and this helper runs on every caught exception.
+_DEBUG_FLAGS: dict[str, bool] = {}
+
+
 def debug_enabled(flag: str = "DEBUG_ERROR_CONTEXT") -> bool:
     """Enable with: DEBUG_ERROR_CONTEXT=1 ..."""
-    return os.getenv(flag) == "1"
+    try:
+        return _DEBUG_FLAGS[flag]
+    except KeyError:
+        enabled = os.getenv(flag) == "1"
+        _DEBUG_FLAGS[flag] = enabled
+        return enabled
+
+
+def invalidate_debug_cache() -> None:
+    """Forget cached flag values (for tests that mutate os.environ)."""
+    _DEBUG_FLAGS.clear()
+
+
+@dataclass(frozen=True)
+class _LineIndex:
+    """Sorted 0-based offsets of every '\\n' in a source string."""
+    newline_offsets: array
+
+
+@lru_cache(maxsize=4)
+def _get_line_index(source: str) -> _LineIndex:
+    """
+    Build (and cache) the newline-offset table for a source string.
+    Uses str.find so the scan runs at C speed, once per source.
+    """
+    offsets = array('i')
+    pos = source.find('\n')
+    while pos != -1:
+        offsets.append(pos)
+        pos = source.find('\n', pos + 1)
+    return _LineIndex(offsets)
 
 
 def index_to_line_col(source: str, index: int) -> Tuple[int, int]:
     """
     Convert 0-based character index into (line, col), both 1-based.
-    Mirrors Reader.set_position logic. 
+    str.count / str.rfind scan at C speed, so a one-shot call here is
+    cheaper than building the newline table first; callers that need
+    many lines of the same source go through _get_line_index instead.
     """
     if index < 0:
         index = 0
     if index > len(source):
         index = len(source)
 
-    line = 1
-    col = 1
-    for i in range(index):
-        if source[i] == "\n":
-            line += 1
-            col = 1
-        else:
-            col += 1
+    line = source.count('\n', 0, index) + 1
+    # rfind returns -1 when no newline precedes index, giving col = index + 1.
+    col = index - source.rfind('\n', 0, index)
     return line, col
 
 
@@ -50,16 +80,16 @@ def line_bounds(source: str, line: int) -> Tuple[int, int]:
     """
     if line <= 0:
         return (0, 0)
-    lines = source.splitlines(keepends=True)
-    if line > len(lines):
-        # if file ends without newline, splitlines still returns last line
+
+    offsets = _get_line_index(source).newline_offsets
+    # Line N starts right after the (N-1)-th newline and ends at the N-th
+    # (or at end of source for the final line without a trailing newline).
+    total_lines = len(offsets) + 1
+    if line > total_lines or (line == total_lines and offsets and offsets[-1] == len(source) - 1):
         return (len(source), len(source))
 
-    start = sum(len(lines[i]) for i in range(line - 1))
-    end = start + len(lines[line - 1])
-    # Strip trailing newline for nicer printing
-    if end > start and source[end - 1] == "\n":
-        end -= 1
+    start = offsets[line - 2] + 1 if line > 1 else 0
+    end = offsets[line - 1] if line - 1 < len(offsets) else len(source)
     return start, end
 
 
@@ -70,68 +100,123 @@ def extract_location_from_exception(source: str, exc: BaseException) -> Optional
     - LexicalError / ErrorBase: exc.position is Position(index,line,column) 
     - SyntaxError: exc.token.start / exc.token.end are indices 
     """
-    # 1) Errors with Position
-    pos = getattr(exc, "position", None)
-    if isinstance(pos, Position):
-        span = 1
-        return SourceLocation(index=pos.index, line=pos.line, column=pos.column, span=span)
+    # 1) Errors with Position. EAFP: most exceptions reaching this point
+    # carry one of the two shapes, so try the attributes directly instead
+    # of probing with getattr defaults and isinstance checks.
+    try:
+        pos = exc.position
+        index, line, column = pos.index, pos.line, pos.column
+    except AttributeError:
+        pass
+    else:
+        return SourceLocation(index=index, line=line, column=column, span=1)
 
     # 2) SyntaxError-like errors with token.start/end
-    token = getattr(exc, "token", None)
-    if token is not None:
-        start = getattr(token, "start", None)
-        end = getattr(token, "end", None)
-        if isinstance(start, int):
-            if not isinstance(end, int) or end < start:
-                end = start + 1
-            line, col = index_to_line_col(source, start)
-            span = max(1, end - start)
-            return SourceLocation(index=start, line=line, column=col, span=span)
-
-    return None
-
-
-def format_error_context(
+    try:
+        token = exc.token
+        start = token.start
+    except AttributeError:
+        return None
+    if not isinstance(start, int):
+        return None
+    end = getattr(token, "end", None)
+    if not isinstance(end, int) or end < start:
+        end = start + 1
+    line, col = index_to_line_col(source, start)
+    return SourceLocation(index=start, line=line, column=col, span=max(1, end - start))
+
+
+# Fixed fragments of the rendered context, named once at module scope so
+# the formatter loads them instead of rebuilding literals per call.
+_HDR = "[ErrorContext] Source context:\n"
+_BAR = " | "
+
+
+def _iter_context_lines(
     source: str,
     loc: SourceLocation,
     *,
     window: int = 1,
-) -> str:
+) -> Iterator[str]:
     """
-    Build a multiline context string:
-      >  12 |   x := y + ;
-                 ^^^
+    Yield the context rows one at a time, each terminated with '\\n', so
+    print_error_context can stream them to stderr without assembling the
+    full string first.
     """
     if not source:
-        return ""
+        return
 
-    lines = source.splitlines()
-    total_lines = len(lines)
+    offsets = _get_line_index(source).newline_offsets
+    total_lines = len(offsets) + (0 if source.endswith('\n') else 1)
     if total_lines == 0:
-        return ""
+        return
 
     line = max(1, min(loc.line, total_lines))
     start_line = max(1, line - window)
     end_line = min(total_lines, line + window)
 
-    # Width for line numbers
+    # Slice just the rendered window out of the source; splitting the
+    # whole file would allocate every line for a three-line print.
+    win_start = offsets[start_line - 2] + 1 if start_line > 1 else 0
+    win_end = offsets[end_line - 1] if end_line - 1 < len(offsets) else len(source)
+    window_lines = source[win_start:win_end].split('\n')
+
+    # Width for line numbers; pad and prefixes are hoisted so the loop
+    # does no repeated string building beyond the line itself.
     width = len(str(end_line))
+    pad = " " * width
+    prefixes = (" ", ">")
+
+    # Caret row depends only on the location, not the loop variable;
+    # rjust pads and concatenates in one C call.
+    caret_body = "^" * max(1, loc.span)
+    caret = caret_body.rjust(max(0, loc.column - 1) + len(caret_body))
+    caret_row = f"  {pad}{_BAR}{caret}\n"
 
-    out = []
-    out.append("[ErrorContext] Source context:")
+    yield _HDR
 
     for ln in range(start_line, end_line + 1):
-        prefix = ">" if ln == line else " "
-        text = lines[ln - 1]
-        out.append(f"{prefix} {ln:>{width}} | {text}")
+        focus = ln == line
+        text = window_lines[ln - start_line]
+        yield f"{prefixes[focus]} {ln:>{width}}{_BAR}{text}\n"
+
+        if focus:
+            yield caret_row
+
+
+def format_error_context(
+    source: str,
+    loc: SourceLocation,
+    *,
+    window: int = 1,
+) -> str:
+    """
+    Build a multiline context string:
+      >  12 |   x := y + ;
+                 ^^^
+    """
+    return "".join(_iter_context_lines(source, loc, window=window)).removesuffix("\n")
 
-        if ln == line:
-            # caret position is 1-based column
-            caret_pos = max(0, loc.column - 1)
-            caret = " " * caret_pos + "^" * max(1, loc.span)
-            out.append(f"  {' ' * width} | {caret}")
 
-    return "\n".join(out)
+def format_contexts(
+    source: str,
+    locs: Sequence[SourceLocation],
+    *,
+    window: int = 1,
+) -> Iterator[str]:
+    """
+    Format contexts for a batch of locations on one source.
+    Builds the newline-offset table once up front and walks the
+    locations in line order so the window slices advance monotonically
+    through the source.
+    """
+    if not source:
+        return
+    _get_line_index(source)
+    for loc in sorted(locs, key=lambda l: l.line):
+        ctx = format_error_context(source, loc, window=window)
+        if ctx:
+            yield ctx
 
 
 def print_error_context(
@@ -143,9 +228,8 @@ def print_error_context(
     """
     Print context to stderr (never stdout).
     """
-    ctx = format_error_context(source, loc, window=window)
-    if ctx:
-        print(ctx, file=sys.stderr)
+    # Stream rows straight to stderr; no intermediate full-context string.
+    sys.stderr.writelines(_iter_context_lines(source, loc, window=window))
 
 
 def maybe_print_error_context_from_exception(